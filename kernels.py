@@ -0,0 +1,36 @@
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+@njit(cache=True, boundscheck=False)
+def fill_product(cs, length, start, n, out):
+    base = cs.shape[0]
+    idx = np.empty(length, dtype=np.int64)
+    rem = start
+    for j in range(length - 1, -1, -1):
+        idx[j] = rem % base
+        rem //= base
+
+    width = length + 1
+    for i in range(n):
+        row = i * width
+        for j in range(length):
+            out[row + j] = cs[idx[j]]
+        out[row + length] = 0x0A
+
+        j = length - 1
+        while j >= 0:
+            idx[j] += 1
+            if idx[j] < base:
+                break
+            idx[j] = 0
+            j -= 1
+
+@njit(cache=True, parallel=True)
+def fill_range(cs, length, start, n_total, out, n_threads):
+    width = length + 1
+    per_thread = (n_total + n_threads - 1) // n_threads
+    for t in prange(n_threads):
+        lo = min(t * per_thread, n_total)
+        hi = min(lo + per_thread, n_total)
+        if hi > lo:
+            fill_product(cs, length, start + lo, hi - lo, out[lo * width:hi * width])
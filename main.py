@@ -1,14 +1,28 @@
 import itertools
+import functools
+import math
 import string
 import argparse
-import random
 import os
+import mmap
+import sys
 import time
 import signal
+import numpy as np
 from tqdm import tqdm
-import pyfiglet
-from colorama import Fore, init 
-import colorama
+
+WRITE_BUFFER_SIZE = 1 << 22
+DIRECT_BLOCK_SIZE = 1 << 20
+SMART_MUTATIONS = 7
+
+PATTERN_GROUPS = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': string.punctuation,
+}
+
+rng = np.random.default_rng()
 
 class GracefulKiller:
     kill_now = False
@@ -19,43 +33,182 @@ class GracefulKiller:
     def exit_gracefully(self, *args):
         self.kill_now = True
 
-def generate_passwords(charset, min_length, max_length, patterns=None):
-    if patterns:
-        for pattern in patterns:
-            yield from generate_password_from_pattern(pattern, charset)
+class DirectWriter:
+    def __init__(self, path, block_size=DIRECT_BLOCK_SIZE):
+        self.fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+        self.block_size = block_size
+        self.buf = mmap.mmap(-1, block_size)
+        self.view = memoryview(self.buf)
+        self.used = 0
+        self.size = 0
+
+    def write(self, data):
+        data = memoryview(data).cast('B')
+        written = len(data)
+        while data:
+            n = min(len(data), self.block_size - self.used)
+            self.view[self.used:self.used + n] = data[:n]
+            self.used += n
+            data = data[n:]
+            if self.used == self.block_size:
+                self._write_block()
+                self.used = 0
+        self.size += written
+        return written
+
+    def _write_block(self):
+        n = os.write(self.fd, self.buf)
+        if n != self.block_size:
+            raise OSError(f"Short write to output file: {n} of {self.block_size} bytes written")
+
+    def close(self):
+        try:
+            if self.used:
+                self.view[self.used:] = bytes(self.block_size - self.used)
+                self._write_block()
+                os.ftruncate(self.fd, self.size)
+        finally:
+            self.view.release()
+            self.buf.close()
+            os.close(self.fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def open_output(path, direct=False):
+    if direct:
+        if hasattr(os, 'O_DIRECT'):
+            try:
+                return DirectWriter(path)
+            except OSError as e:
+                print(f"Direct I/O unavailable ({e}), using buffered output")
+        else:
+            print("Direct I/O is only supported on Linux, using buffered output")
+    return open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+
+def compile_patterns(patterns, charset):
+    return [[PATTERN_GROUPS.get(char, charset) for char in pattern] for pattern in patterns]
+
+def generate_passwords(charset, min_length, max_length, pattern_parts=None):
+    if pattern_parts:
+        for parts in pattern_parts:
+            yield from map(''.join, itertools.product(*parts))
     else:
         for length in range(min_length, max_length + 1):
-            yield from (''.join(p) for p in itertools.product(charset, repeat=length))
-
-def generate_password_from_pattern(pattern, charset):
-    parts = []
-    for char in pattern:
-        if char == 'l':
-            parts.append(string.ascii_lowercase)
-        elif char == 'u':
-            parts.append(string.ascii_uppercase)
-        elif char == 'd':
-            parts.append(string.digits)
-        elif char == 's':
-            parts.append(string.punctuation)
-        else:
-            parts.append(charset)
-    yield from (''.join(p) for p in itertools.product(*parts))
-
-def generate_smart_mutations(word):
-    yield word
-    yield word.capitalize()
-    yield word.upper()
-    yield word.lower()
-    yield word[::-1]
-    yield word + str(random.randint(0, 9999))
-    yield ''.join(c if random.random() > 0.3 else c.upper() for c in word)
-
-def save_passwords(passwords, output_file, append=False):
-    mode = 'a' if append else 'w'
-    with open(output_file, mode) as f:
-        for password in passwords:
-            f.write(password + '\n')
+            yield from map(''.join, itertools.product(charset, repeat=length))
+
+def count_passwords(charset, min_length, max_length, pattern_parts=None):
+    if pattern_parts:
+        return sum(math.prod(map(len, parts)) for parts in pattern_parts)
+    return sum(len(charset) ** length for length in range(min_length, max_length + 1))
+
+def generate_smart_mutations(words):
+    encoded = [word.encode('utf-8') for word in words]
+    width = max(1, max(map(len, encoded)))
+    arr = np.array(encoded, dtype=f'S{width}').view(np.uint8).reshape(len(encoded), width)
+    # one random byte per character, below 77 is ~30% of 256
+    flip = (arr >= ord('a')) & (arr <= ord('z')) & (rng.integers(0, 256, arr.shape, dtype=np.uint8) < 77)
+    mixed = list(map(bytes.decode, (arr ^ (flip.view(np.uint8) << 5)).view(f'S{width}').ravel().tolist()))
+    if not all(map(str.isascii, words)):
+        for i, word in enumerate(words):
+            if not word.isascii():
+                draws = rng.integers(0, 256, len(word)).tolist()
+                mixed[i] = ''.join(c.upper() if r < 77 else c for c, r in zip(word, draws))
+    numbers = rng.integers(0, 10000, len(words)).tolist()
+
+    mutations = []
+    for word, number, mixed_word in zip(words, numbers, mixed):
+        mutations.extend((
+            word,
+            word.capitalize(),
+            word.upper(),
+            word.lower(),
+            word[::-1],
+            word + str(number),
+            mixed_word,
+        ))
+    return mutations
+
+def save_passwords(passwords, fh):
+    if passwords:
+        fh.write('\n'.join(passwords).encode('utf-8'))
+        fh.write(b'\n')
+
+def write_chunks(fh, passwords, chunk_size, smart=False):
+    while True:
+        chunk = list(itertools.islice(passwords, chunk_size))
+        if not chunk:
+            return
+
+        if smart:
+            chunk = generate_smart_mutations(chunk)
+
+        save_passwords(chunk, fh)
+        yield len(chunk)
+
+@functools.lru_cache(maxsize=None)
+def load_fill_range():
+    try:
+        from kernels import fill_range, get_num_threads
+    except ImportError:
+        return None
+    return fill_range, get_num_threads
+
+def render_range(parts, lo, hi):
+    length = len(parts)
+    out = np.empty((hi - lo, length + 1), dtype=np.uint8)
+    index = np.arange(lo, hi, dtype=np.int64)
+    for j in range(length - 1, -1, -1):
+        part = np.frombuffer(parts[j].encode('ascii'), dtype=np.uint8)
+        index, digit = np.divmod(index, len(part))
+        out[:, j] = part[digit]
+    out[:, length] = 0x0A
+    return out.tobytes()
+
+def _emit_parts(fh, parts, batch_size=1 << 16):
+    total = math.prod(map(len, parts))
+    if not all(part.isascii() for part in parts) or total > np.iinfo(np.int64).max:
+        yield from write_chunks(fh, map(''.join, itertools.product(*parts)), batch_size)
+        return
+
+    for start in range(0, total, batch_size):
+        end = min(start + batch_size, total)
+        fh.write(render_range(parts, start, end))
+        yield end - start
+
+def _emit_length(fh, charset, length, batch_size=1 << 16):
+    total = len(charset) ** length
+    kernels = None
+    if charset.isascii() and total <= np.iinfo(np.int64).max:
+        kernels = load_fill_range()
+    if kernels is None:
+        yield from _emit_parts(fh, [charset] * length, batch_size)
+        return
+
+    fill_range, get_num_threads = kernels
+    cs = np.frombuffer(charset.encode('ascii'), dtype=np.uint8)
+    n_threads = get_num_threads()
+    batch_size *= n_threads
+    width = length + 1
+    buf = np.empty(batch_size * width, dtype=np.uint8)
+    for start in range(0, total, batch_size):
+        n = min(batch_size, total - start)
+        fill_range(cs, length, start, n, buf, n_threads)
+        fh.write(buf[:n * width])
+        yield n
+
+def print_banner():
+    import colorama
+    import pyfiglet
+
+    print(colorama.Fore.RED)
+    pyfiglet.print_figlet("Asylum")
+    print(colorama.Fore.GREEN)
+    print("        Password List Generator")
+    print(colorama.Fore.RESET)
 
 def main():
     parser = argparse.ArgumentParser(description="Advanced Password List Generator")
@@ -70,13 +223,12 @@ def main():
     parser.add_argument("-o", type=str, default="passwords.txt", help="Output file name")
     parser.add_argument("--smart", action="store_true", help="Use smart password generation")
     parser.add_argument("--chunk-size", type=int, default=10000, help="Chunk size for password generation")
+    parser.add_argument("--direct", action="store_true", help="Write the output file with O_DIRECT, bypassing the page cache (Linux)")
+    parser.add_argument("--quiet", action="store_true", help="Hide the banner and progress bar")
     args = parser.parse_args()
 
-    print(colorama.Fore.RED)
-    pyfiglet.print_figlet("Asylum")
-    print(colorama.Fore.GREEN)
-    print("        Password List Generator")
-    print(colorama.Fore.RESET)
+    if sys.stdout.isatty() and not args.quiet:
+        print_banner()
     print("Advanced Password List Generator")
     print("================================")
 
@@ -94,13 +246,20 @@ def main():
     print(f"Character set: {charset}")
 
     patterns = args.p.split(',') if args.p else None
+    pattern_parts = None
     if patterns:
         print(f"Password patterns: {patterns}")
+        pattern_parts = compile_patterns(patterns, charset)
 
     if args.min > args.max:
         print("Error: Minimum password length cannot be greater than maximum length.")
         return
 
+    total_passwords = count_passwords(charset, args.min, args.max, pattern_parts)
+    if args.smart:
+        total_passwords *= SMART_MUTATIONS
+    print(f"Total passwords to generate: {total_passwords:,}")
+
     killer = GracefulKiller()
     
     start_time = time.time()
@@ -109,22 +268,27 @@ def main():
     print(f"Starting password generation...")
 
     try:
-        with open(args.o, 'w') as outfile:
-            for password in generate_passwords(charset, args.min, args.max, patterns):
-                if killer.kill_now:
-                    print("\nStopping password generation...")
-                    break
-
-                if args.smart:
-                    for smart_password in generate_smart_mutations(password):
-                        outfile.write(smart_password + '\n')
-                        passwords_generated += 1
-                else:
-                    outfile.write(password + '\n')
-                    passwords_generated += 1
-
-                if passwords_generated % args.chunk_size == 0:
-                    print(f"Progress: {passwords_generated:,} passwords generated")
+        with open_output(args.o, args.direct) as outfile:
+            if args.smart:
+                passwords = generate_passwords(charset, args.min, args.max, pattern_parts)
+                batches = write_chunks(outfile, passwords, args.chunk_size, args.smart)
+            elif pattern_parts:
+                batches = (count for parts in pattern_parts
+                           for count in _emit_parts(outfile, parts, args.chunk_size))
+            else:
+                batches = (count for length in range(args.min, args.max + 1)
+                           for count in _emit_length(outfile, charset, length, args.chunk_size))
+
+            with tqdm(total=total_passwords, unit=" passwords", mininterval=0.5,
+                      miniters=max(1, args.chunk_size // 4), smoothing=0,
+                      disable=args.quiet or not sys.stderr.isatty()) as pbar:
+                for count in batches:
+                    passwords_generated += count
+                    pbar.update(count)
+
+                    if killer.kill_now:
+                        pbar.write("\nStopping password generation...")
+                        break
 
     except IOError as e:
         print(f"Error writing to file: {e}")